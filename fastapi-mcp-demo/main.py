@@ -1,12 +1,39 @@
-from fastapi import FastAPI, Query
-from pydantic import BaseModel, Field
-from fastapi_mcp import FastApiMCP
+import math
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Final
+
+from fastapi import FastAPI, HTTPException, Query
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field
+from fastapi_mcp import FastApiMCP  # type: ignore[import-untyped]
+
+# ── BMI computation ────────────────────────────────
+# Lower bounds of each category after the first; bisect_right maps a value
+# onto its label, so 25.0 and 30.0 start "Overweight" and "Obesity".
+_BMI_CUTS: Final[tuple[float, ...]] = (18.5, 25.0, 30.0)
+_BMI_LABELS: Final[tuple[str, ...]] = (
+    "Underweight", "Normal weight", "Overweight", "Obesity")
+
+@lru_cache(maxsize=1024)
+def _compute(weight_kg: float, height_m: float) -> tuple[float, str]:
+    h2 = height_m * height_m
+    raw = weight_kg / h2 if h2 else math.inf
+    scaled = raw * 100.0
+    if not (math.isfinite(h2) and math.isfinite(scaled)):
+        raise ValueError("BMI is out of range for the given inputs")
+    # Round half up to 2 dp; inputs are positive (Query gt=0).
+    value = int(scaled + 0.5) / 100.0
+    return value, _BMI_LABELS[bisect_right(_BMI_CUTS, value)]
 
 # ── Data model ─────────────────────────────────────
 class BMIResponse(BaseModel):
-    bmi: float = Field(..., example=22.86,
-                       description="Body‑mass index rounded to 2 dp")
-    assessment: str = Field(..., example="Normal weight")
+    model_config = ConfigDict(json_schema_extra={
+        "example": {"bmi": 22.86, "assessment": "Normal weight"},
+    })
+
+    bmi: float = Field(..., description="Body‑mass index rounded to 2 dp")
+    assessment: str
 
 # ── FastAPI app ────────────────────────────────────
 app = FastAPI(title="Intelligent Health API",
@@ -17,19 +44,17 @@ app = FastAPI(title="Intelligent Health API",
          operation_id="calculate_bmi",
          summary="Calculate BMI & return a WHO assessment",
          response_model=BMIResponse,
+         response_class=ORJSONResponse,
          tags=["Health"])
-def bmi(weight_kg: float = Query(..., gt=0, examples=70.5),
-        height_m: float = Query(..., gt=0, examples=1.75)):
-    value = round(weight_kg / height_m ** 2, 2)
-    if value < 18.5:
-        status = "Underweight"
-    elif value <= 24.9:
-        status = "Normal weight"
-    elif value <= 29.9:
-        status = "Overweight"
-    else:
-        status = "Obesity"
-    return BMIResponse(bmi=value, assessment=status)
+def bmi(weight_kg: float = Query(..., gt=0, examples=[70.5]),
+        height_m: float = Query(..., gt=0, examples=[1.75])) -> BMIResponse:
+    try:
+        value, status = _compute(weight_kg, height_m)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    # Both fields come from _compute, so validation is skipped here; build
+    # BMIResponse with the normal constructor anywhere else.
+    return BMIResponse.model_construct(bmi=value, assessment=status)
 
 # ── MCP integration ────────────────────────────────
 mcp = FastApiMCP(